@@ -10,12 +10,22 @@ import json
 import pyperclip
 import os
 from src.config import get_chrome_options
-from datetime import datetime
+from datetime import date
+
+_DATE_FORMAT = "%m/%d/%Y"
+_TODAY_CACHE = [None, '']  # [date, formatted], refreshed when the day changes
+
+def _today_str() -> str:
+    """Return today's date as MM/DD/YYYY, formatting it once per day."""
+    today = date.today()
+    if _TODAY_CACHE[0] != today:
+        _TODAY_CACHE[:] = [today, today.strftime(_DATE_FORMAT)]
+    return _TODAY_CACHE[1]
 
 def format_output(job_data):
     """Return CSV-formatted string for clipboard from job_data."""
-    today = datetime.now().strftime("%m/%d/%Y")
-    fields = [
+    today = _today_str()
+    fields = (
         job_data.company,
         job_data.title,
         job_data.location + (' (Remote)' if job_data.is_remote else ''),
@@ -27,8 +37,8 @@ def format_output(job_data):
         job_data.salary,
         job_data.posted,
         job_data.applicants
-    ]
-    return '"' + '","'.join(str(field) if field is not None else '' for field in fields) + '"'
+    )
+    return '"' + '","'.join(['' if field is None else str(field) for field in fields]) + '"'
 
 def is_valid_job_url(url: str, base_url: str = "https://www.linkedin.com/jobs") -> bool:
     """Return True if the URL is a LinkedIn job posting."""
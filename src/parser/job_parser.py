@@ -10,6 +10,10 @@ from selenium.webdriver.common.by import By
 
 logger = logging.getLogger(__name__)
 
+# Exclusion filters for candidate lines, compiled once at import
+_COMPANY_BAD_RX = re.compile(r'about|show more', re.IGNORECASE)
+_TITLE_BAD_RX = re.compile(r'logo|notifications|total|united states|\$', re.IGNORECASE)
+
 class JobParser:
     """LinkedIn job posting parser that extracts structured data from clipboard content.
     
@@ -197,7 +201,7 @@ class JobParser:
             if 'company logo' in line.lower():
                 if i+1 < len(lines):
                     company = lines[i+1].strip()
-                    if company and not any(x in company.lower() for x in ['about', 'show more']):
+                    if company and not _COMPANY_BAD_RX.search(company):
                         return company
         return "Unknown"
 
@@ -428,7 +432,7 @@ class JobParser:
                 
                 # Validate the potential title
                 if (potential_title and
-                    not any(x in potential_title.lower() for x in ['logo', 'notifications', 'total', 'united states', '$']) and
+                    not _TITLE_BAD_RX.search(potential_title) and
                     not potential_title.endswith(('ago', 'applicants')) and
                     len(potential_title.split()) <= 10):
                     return potential_title
@@ -436,7 +440,7 @@ class JobParser:
             if "Share options" in line or "Show more options" in line:
                 next_line = lines[i+1] if i + 1 < len(lines) else ""
                 if (next_line and
-                    not any(x in next_line.lower() for x in ['logo', 'notifications', 'total', 'united states', '$']) and
+                    not _TITLE_BAD_RX.search(next_line) and
                     not next_line.endswith(('ago', 'applicants')) and
                     len(next_line.split()) <= 10):
                     return next_line
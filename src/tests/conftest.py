@@ -3,6 +3,8 @@ from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from ..extractors.browser import BrowserExtractor
 from ..extractors.base import JobData
+from ..parser.job_parser import JobParser
+from .helpers.snapshot_helper import load_snapshots
 
 @pytest.fixture
 def mock_browser():
@@ -26,4 +28,30 @@ def sample_job_data():
         posted="2 days ago",
         url="https://linkedin.com/jobs/test",
         raw_data="Sample raw data"
-    ) 
\ No newline at end of file
+    ) 
+
+def pytest_generate_tests(metafunc):
+    """Run tests taking snapshot_file/snapshot_data once per v3 snapshot"""
+    if "snapshot_file" in metafunc.fixturenames:
+        # Same cached load the snapshots fixture uses; no snapshots means no cases
+        cases = load_snapshots()
+        metafunc.parametrize("snapshot_file, snapshot_data", cases,
+                             ids=[path.name for path, _ in cases])
+
+@pytest.fixture(scope="session")
+def snapshots():
+    """All v3 snapshots as (path, data) pairs, read from disk once per session"""
+    snapshots = load_snapshots()
+    if not snapshots:
+        pytest.skip("No snapshots found in snapshots/v3")
+    return snapshots
+
+@pytest.fixture(scope="session")
+def parser():
+    """Single JobParser shared by the whole test session"""
+    return JobParser()
+
+@pytest.fixture(scope="session")
+def parsed_snapshots(snapshots, parser):
+    """Map each snapshot path to (data, JobPost) so raw_text is parsed once per session"""
+    return {path: (data, parser.parse(data.get("raw_text", ""))) for path, data in snapshots}
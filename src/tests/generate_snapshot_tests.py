@@ -9,13 +9,12 @@ def generate_baseline_tests():
     test_cases = []
     
     for snapshot_file in snapshots_dir.glob("linkedin_snapshot_*.json"):
-        with open(snapshot_file) as f:
-            snapshot = json.load(f)
-            test_cases.append({
-                'name': snapshot_file.stem,
-                'raw_text': snapshot['raw_text'],
-                'expected': snapshot['parsed_data']
-            })
+        snapshot = json.loads(snapshot_file.read_bytes())
+        test_cases.append({
+            'name': snapshot_file.stem,
+            'raw_text': snapshot['raw_text'],
+            'expected': snapshot['parsed_data']
+        })
     
     # Template for test file
     template = """
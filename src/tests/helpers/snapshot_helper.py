@@ -1,6 +1,34 @@
+from functools import lru_cache
 from pathlib import Path
 import json
-from typing import Dict, Any
+import os
+from typing import Dict, Any, Iterator, Tuple
+from ...utils.dir_cache import list_snapshot_names
+
+
+def iter_snapshot_paths(snapshots_dir: str = "snapshots/v3") -> Iterator[str]:
+    """Yield snapshot file paths from the cached directory listing"""
+    for name in list_snapshot_names(snapshots_dir):
+        yield os.path.join(snapshots_dir, name)
+
+
+@lru_cache(maxsize=None)
+def load_snapshots(snapshots_dir: str = "snapshots/v3") -> Tuple[Tuple[Path, Dict[str, Any]], ...]:
+    """Load every snapshot in a directory once and cache the parsed JSON.
+
+    Returns a tuple of (path, data) pairs, or an empty tuple if the
+    directory doesn't exist. Callers share the same dicts, so in-place
+    edits (e.g. snapshot fixes) stay consistent with what was written.
+    """
+    if not os.path.isdir(snapshots_dir):
+        return ()
+
+    snapshots = []
+    for snapshot_path in iter_snapshot_paths(snapshots_dir):
+        snapshot_file = Path(snapshot_path)
+        snapshots.append((snapshot_file, json.loads(snapshot_file.read_bytes())))
+    return tuple(snapshots)
+
 
 class SnapshotHelper:
     def __init__(self, snapshots_dir: str = "snapshots/v3"):
@@ -14,8 +42,7 @@ class SnapshotHelper:
         if not snapshot_file.exists():
             raise FileNotFoundError(f"Snapshot not found: {snapshot_id}")
             
-        with open(snapshot_file) as f:
-            return json.load(f)
+        return json.loads(snapshot_file.read_bytes())
 
     def get_raw_text(self, snapshot_id: str) -> str:
         """Get raw text from snapshot"""
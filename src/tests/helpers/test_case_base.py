@@ -1,12 +1,7 @@
 import pytest
 from .snapshot_helper import SnapshotHelper
-from src.parser.job_parser import JobParser
 
 class BaseParserTest:
-    @pytest.fixture
-    def parser(self):
-        return JobParser()
-    
     @pytest.fixture
     def helper(self):
         return SnapshotHelper()
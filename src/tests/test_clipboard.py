@@ -31,6 +31,21 @@ def test_csv_detection():
             "Just some random text with, commas, in it",
             False,
             "Should not detect text with commas as CSV"
+        ),
+        (
+            '","Senior Engineering Manager","Pleasanton, CA","","11/03/2024","LinkedIn","11/03/2024","","","","","","Easy Apply","$130,000 - $300,000","7","4"',
+            False,
+            "Should not detect a separator at the very start as CSV"
+        ),
+        (
+            '"Veeva Systems","Senior Engineering Manager","Pleasanton, CA","","11/03/2024","LinkedIn","11/03/2024","","","","","","Easy Apply","$130,000 - $300,000","7","',
+            False,
+            "Should not detect a separator at the very end as CSV"
+        ),
+        (
+            '"Veeva Systems","Senior Engineering Manager - Cloud Infrastructure","Pleasanton, CA (Remote)","","11/03/2024","Indeed","11/03/2024","","","","","","Easy Apply","$130,000 - $300,000","7","4"',
+            False,
+            "Should not detect CSV without LinkedIn as the 6th field"
         )
     ]
     
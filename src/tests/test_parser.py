@@ -1,11 +1,13 @@
-import pytest
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 import json
-from ..parser.job_parser import JobParser
+import re
 
-@pytest.fixture
-def parser():
-    return JobParser()
+# LinkedIn header content that leaks into company names
+_HEADER_CONTENT = re.compile(r"^0 notifications|notifications total")
+_BAD_COMPANY = re.compile(r"^0|notifications total|\n")
+_INVALID_COMPANY = re.compile(r"^0|notifications|\n")
+# "company logo" line plus the 4 lines after it
+_LOGO_CONTEXT = re.compile(r"(?im)^.*company logo.*(?:\n.*){0,4}")
 
 def test_title_cleaning(parser):
     """Test that job titles are properly cleaned of LinkedIn metadata"""
@@ -18,64 +20,54 @@ $170K/yr - $200K/yrMatches your job preferences, minimum pay preference is 18000
 
 class TestCompanyParsing:
     """Test suite for company name parsing functionality."""
-    
-    @pytest.fixture
-    def parser(self):
-        return JobParser()
 
     def test_company_parsing(self):
         pass
 
-def test_analyze_company_snapshots(parser):
+def test_analyze_company_snapshots(parsed_snapshots):
     """Analyze company data quality in snapshots"""
-    snapshots_dir = Path("snapshots/v3")
-    assert snapshots_dir.exists(), "Snapshots directory not found"
-    
     print("\nCompany Data Analysis in Snapshots:")
     print("=================================")
     
     issues = []
     good_data = []
     
-    for snapshot_file in snapshots_dir.glob("linkedin_snapshot_*.json"):
-        with open(snapshot_file) as f:
-            snapshot = json.load(f)
-            raw_text = snapshot["raw_text"]
-            expected = snapshot["parsed_data"]["company"]
-            parsed = parser.parse(raw_text).company
+    for snapshot_file, (snapshot, job_post) in parsed_snapshots.items():
+        expected = snapshot["parsed_data"]["company"]
+        parsed = job_post.company
             
-            # Check for potential data quality issues
-            has_issues = False
-            issue_details = []
+        # Check for potential data quality issues
+        has_issues = False
+        issue_details = []
             
-            if expected == "Unknown":
-                has_issues = True
-                issue_details.append("Expected company is 'Unknown'")
+        if expected == "Unknown":
+            has_issues = True
+            issue_details.append("Expected company is 'Unknown'")
             
-            if '\n' in expected:
-                has_issues = True
-                issue_details.append("Contains newlines")
+        if '\n' in expected:
+            has_issues = True
+            issue_details.append("Contains newlines")
                 
-            if expected.startswith('0 notifications') or 'notifications total' in expected:
-                has_issues = True
-                issue_details.append("Contains LinkedIn header content")
+        if _HEADER_CONTENT.search(expected):
+            has_issues = True
+            issue_details.append("Contains LinkedIn header content")
                 
-            if len(expected) > 50:  # Likely contains extra content
-                has_issues = True
-                issue_details.append("Suspiciously long company name")
+        if len(expected) > 50:  # Likely contains extra content
+            has_issues = True
+            issue_details.append("Suspiciously long company name")
             
-            if has_issues:
-                issues.append({
-                    'file': snapshot_file.name,
-                    'expected': expected,
-                    'parsed': parsed,
-                    'issues': issue_details
-                })
-            else:
-                good_data.append({
-                    'file': snapshot_file.name,
-                    'company': expected
-                })
+        if has_issues:
+            issues.append({
+                'file': snapshot_file.name,
+                'expected': expected,
+                'parsed': parsed,
+                'issues': issue_details
+            })
+        else:
+            good_data.append({
+                'file': snapshot_file.name,
+                'company': expected
+            })
     
     # Report findings
     print("\nSnapshots with Issues:")
@@ -96,100 +88,113 @@ def test_analyze_company_snapshots(parser):
     print(f"Clean snapshots: {len(good_data)}")
     print(f"Snapshots with issues: {len(issues)}")
 
+def _write_snapshot(pending):
+    """Write a (path, data) snapshot pair back to disk."""
+    snapshot_file, data = pending
+    # Snapshots stay indented for review; encode in one call rather than
+    # letting json.dump issue a write per token
+    snapshot_file.write_text(json.dumps(data, indent=2))
+
+def _check_company(data, job_post):
+    """Return company data quality issues for a single snapshot."""
+    issues = []
+    company = data["parsed_data"]["company"]
+
+    if company == "Unknown":
+        # Check if parser finds something
+        parsed = job_post.company
+        if parsed != "Unknown":
+            issues.append(f"Marked as Unknown but parser found '{parsed}'")
+    elif _INVALID_COMPANY.search(company):
+        issues.append(f"Contains invalid content: '{company}'")
+
+    return issues
+
 class TestSnapshotMaintenance:
     """Tests and maintenance for snapshot data quality."""
     
-    @pytest.fixture
-    def parser(self):
-        return JobParser()
-    
-    def test_fix_company_data(self, parser):
+    def test_fix_company_data(self, parsed_snapshots):
         """Fix company data while preserving original raw text."""
-        snapshots_dir = Path("snapshots/v3")
         updates_made = 0
         
         print("\nFixing Company Data in Snapshots:")
         print("===============================")
         
-        for snapshot_file in snapshots_dir.glob("linkedin_snapshot_*.json"):
-            with open(snapshot_file) as f:
-                data = json.load(f)
-                
-            # Verify snapshot structure
-            assert "raw_text" in data, f"Missing raw_text in {snapshot_file}"
-            assert "parsed_data" in data, f"Missing parsed_data in {snapshot_file}"
-            
-            original_raw_text = data["raw_text"]
-            company = data["parsed_data"]["company"]
+        # Collect fixes and write them in one pass after the scan
+        pending_writes = []
+        try:
+            for snapshot_file, (data, parsed_result) in parsed_snapshots.items():
+                # Verify snapshot structure
+                assert "raw_text" in data, f"Missing raw_text in {snapshot_file}"
+                assert "parsed_data" in data, f"Missing parsed_data in {snapshot_file}"
             
-            # Parse using current parser
-            parsed_result = parser.parse(original_raw_text)
+                original_raw_text = data["raw_text"]
+                company = data["parsed_data"]["company"]
             
-            needs_update = False
-            if ('notifications total' in company or 
-                company.startswith('0') or 
-                '\n' in company):
-                needs_update = True
-            elif company == "Unknown" and parsed_result.company != "Unknown":
-                needs_update = True
+                needs_update = False
+                if _BAD_COMPANY.search(company):
+                    needs_update = True
+                elif company == "Unknown" and parsed_result.company != "Unknown":
+                    needs_update = True
             
-            if needs_update:
-                print(f"\nUpdating {snapshot_file.name}")
-                print(f"Old value: '{company}'")
-                print(f"New value: '{parsed_result.company}'")
-                
-                # Only update parsed_data, preserve raw_text
-                data["parsed_data"]["company"] = parsed_result.company
+                if needs_update:
+                    print(f"\nUpdating {snapshot_file.name}")
+                    print(f"Old value: '{company}'")
+                    print(f"New value: '{parsed_result.company}'")
                 
-                # Verify raw_text wasn't modified
-                assert data["raw_text"] == original_raw_text, \
-                    f"Error: raw_text was modified in {snapshot_file}"
+                    # Only update parsed_data, preserve raw_text
+                    data["parsed_data"]["company"] = parsed_result.company
                 
-                with open(snapshot_file, 'w') as f:
-                    json.dump(data, f, indent=2)
+                    # Verify raw_text wasn't modified
+                    assert data["raw_text"] == original_raw_text, \
+                        f"Error: raw_text was modified in {snapshot_file}"
                 
-                updates_made += 1
+                    pending_writes.append((snapshot_file, data))
+                    updates_made += 1
+        finally:
+            # Writes are independent, so overlap their I/O across threads
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                list(executor.map(_write_snapshot, pending_writes))
         
         print(f"\nFixing complete. Updated {updates_made} snapshots.")
         
         print("\nVerifying snapshot integrity...")
-        # Verify all snapshots after updates
-        for snapshot_file in snapshots_dir.glob("linkedin_snapshot_*.json"):
-            with open(snapshot_file) as f:
-                data = json.load(f)
-                assert "raw_text" in data, f"Missing raw_text in {snapshot_file}"
-                assert "parsed_data" in data, f"Missing parsed_data in {snapshot_file}"
+        # Verify all snapshots after updates; rewritten files are re-read from
+        # disk so the check covers what _write_snapshot actually wrote
+        written = {snapshot_file for snapshot_file, _ in pending_writes}
+        for snapshot_file, (data, _) in parsed_snapshots.items():
+            if snapshot_file in written:
+                data = json.loads(snapshot_file.read_bytes())
+            assert "raw_text" in data, f"Missing raw_text in {snapshot_file}"
+            assert "parsed_data" in data, f"Missing parsed_data in {snapshot_file}"
                 
-                # Verify no header content in company names
-                company = data["parsed_data"]["company"]
-                assert 'notifications total' not in company, \
-                    f"Found header content in {snapshot_file}"
-                assert not company.startswith('0'), \
-                    f"Found invalid company start in {snapshot_file}"
-                assert '\n' not in company, \
-                    f"Found newlines in company in {snapshot_file}"
+            # Verify no header content in company names
+            company = data["parsed_data"]["company"]
+            assert 'notifications total' not in company, \
+                f"Found header content in {snapshot_file}"
+            assert not company.startswith('0'), \
+                f"Found invalid company start in {snapshot_file}"
+            assert '\n' not in company, \
+                f"Found newlines in company in {snapshot_file}"
     
-    def test_analyze_unknown_companies(self, parser):
+    def test_analyze_unknown_companies(self, parsed_snapshots):
         """Analyze snapshots where company is marked as 'Unknown'"""
-        snapshots_dir = Path("snapshots/v3")
         unknown_cases = []
         
         print("\nAnalyzing 'Unknown' Company Cases:")
         print("================================")
         
-        for snapshot_file in snapshots_dir.glob("linkedin_snapshot_*.json"):
-            with open(snapshot_file) as f:
-                data = json.load(f)
-                raw_text = data["raw_text"]
-                expected = data["parsed_data"]["company"]
+        for snapshot_file, (data, job_post) in parsed_snapshots.items():
+            raw_text = data["raw_text"]
+            expected = data["parsed_data"]["company"]
                 
-                if expected == "Unknown":
-                    parsed = parser.parse(raw_text).company
-                    unknown_cases.append({
-                        'file': snapshot_file.name,
-                        'parsed_as': parsed,
-                        'raw_text': raw_text[:200]  # First 200 chars for context
-                    })
+            if expected == "Unknown":
+                parsed = job_post.company
+                unknown_cases.append({
+                    'file': snapshot_file.name,
+                    'parsed_as': parsed,
+                    'raw_text': raw_text[:200]  # First 200 chars for context
+                })
         
         if unknown_cases:
             print(f"\nFound {len(unknown_cases)} cases with 'Unknown' company:")
@@ -202,110 +207,55 @@ class TestSnapshotMaintenance:
         else:
             print("No 'Unknown' company cases found!")
 
-    def test_verify_company_data_quality(self, parser):
-        """Verify the quality of company data in all snapshots."""
-        snapshots_dir = Path("snapshots/v3")
-        
+    def test_verify_company_data_quality(self, snapshot_file, snapshot_data, parsed_snapshots):
+        """Verify the quality of company data in each snapshot."""
+        issues = _check_company(snapshot_data, parsed_snapshots[snapshot_file][1])
+        assert not issues, f"{snapshot_file.name}: " + "; ".join(issues)
+
+    def test_company_data_summary(self, snapshots):
+        """Verify the snapshot corpus as a whole has real company names."""
         print("\nAnalyzing Company Data Quality:")
         print("============================")
         
-        stats = {
-            'total': 0,
-            'unknown': 0,
-            'valid': 0,
-            'issues': []
-        }
-        
-        companies_found = set()
-        
-        for snapshot_file in snapshots_dir.glob("linkedin_snapshot_*.json"):
-            with open(snapshot_file) as f:
-                data = json.load(f)
-                
-            stats['total'] += 1
-            company = data["parsed_data"]["company"]
-            
-            if company == "Unknown":
-                stats['unknown'] += 1
-                # Check if parser finds something
-                parsed = parser.parse(data["raw_text"]).company
-                if parsed != "Unknown":
-                    stats['issues'].append({
-                        'file': snapshot_file.name,
-                        'issue': f"Marked as Unknown but parser found '{parsed}'"
-                    })
-            else:
-                stats['valid'] += 1
-                companies_found.add(company)
-                
-                # Check for any remaining issues
-                if (('notifications' in company) or 
-                    company.startswith('0') or 
-                    '\n' in company):
-                    stats['issues'].append({
-                        'file': snapshot_file.name,
-                        'issue': f"Contains invalid content: '{company}'"
-                    })
+        companies = [data["parsed_data"]["company"] for _, data in snapshots]
+        companies_found = {company for company in companies if company != "Unknown"}
+        valid = sum(company != "Unknown" for company in companies)
         
-        # Print results
         print(f"\nResults:")
         print(f"--------")
-        print(f"Total snapshots: {stats['total']}")
-        print(f"Valid companies: {stats['valid']}")
-        print(f"Unknown companies: {stats['unknown']}")
+        print(f"Total snapshots: {len(companies)}")
+        print(f"Valid companies: {valid}")
+        print(f"Unknown companies: {len(companies) - valid}")
         
         print("\nUnique companies found:")
         print("--------------------")
         for company in sorted(companies_found):
             print(f"- {company}")
         
-        if stats['issues']:
-            print("\nIssues found:")
-            print("-------------")
-            for issue in stats['issues']:
-                print(f"- {issue['file']}: {issue['issue']}")
-        else:
-            print("\nNo issues found!")
-        
-        # Assertions to validate data quality
-        assert stats['total'] > 0, "No snapshots found"
-        assert stats['valid'] > 0, "No valid companies found"
-        assert len(stats['issues']) == 0, f"Found {len(stats['issues'])} issues in snapshots"
+        assert len(companies) > 0, "No snapshots found"
+        assert valid > 0, "No valid companies found"
         assert len(companies_found) > 0, "No unique companies found"
         
-        # Print summary
-        print(f"\nVerification passed!")
-        print(f"Found {len(companies_found)} unique companies in {stats['total']} snapshots")
+        print(f"\nFound {len(companies_found)} unique companies in {len(companies)} snapshots")
 
-    def test_analyze_company_whitespace(self, parser):
+    def test_analyze_company_whitespace(self, snapshots):
         """Analyze whitespace patterns in company names from real snapshots."""
-        snapshots_dir = Path("snapshots/v3")
-        
         print("\nAnalyzing Company Name Whitespace in Snapshots:")
         print("==========================================")
         
-        for snapshot_file in snapshots_dir.glob("linkedin_snapshot_*.json"):
-            with open(snapshot_file) as f:
-                data = json.load(f)
-                raw_text = data["raw_text"]
+        for snapshot_file, data in snapshots:
+            raw_text = data["raw_text"]
                 
-                # Find the "company logo" line and next few lines
-                lines = raw_text.split('\n')
-                for i, line in enumerate(lines):
-                    if 'company logo' in line.lower():
-                        context = '\n'.join(lines[i:i+5])  # Show next 5 lines for context
-                        print(f"\nFile: {snapshot_file.name}")
-                        print("Context:")
-                        print(context)
-                        print("-" * 50)
-                        break
+            # Find the "company logo" line and next few lines
+            match = _LOGO_CONTEXT.search(raw_text)
+            if match:
+                print(f"\nFile: {snapshot_file.name}")
+                print("Context:")
+                print(match.group(0))
+                print("-" * 50)
 
-def test_title_parsing_from_snapshots(parser):
+def test_title_parsing_from_snapshots(parsed_snapshots):
     """Analyze title parsing across all snapshots to establish patterns and accuracy."""
-    snapshots_dir = Path("snapshots/v3")
-    assert snapshots_dir.exists(), "Snapshots directory not found"
-
-    snapshots = list(snapshots_dir.glob("linkedin_snapshot_*.json"))
     print("\nTitle Parsing Analysis:")
     print("-" * 30)
     print()
@@ -313,32 +263,27 @@ def test_title_parsing_from_snapshots(parser):
     good_snapshots = []
     total_valid = 0
 
-    for snapshot_file in snapshots:
-        with open(snapshot_file) as f:
-            snapshot = json.load(f)
-            
-            # Parse the raw text
-            raw_text = snapshot["raw_text"]
-            job_post = parser.parse(raw_text)
-            expected = snapshot["parsed_data"]
+    for snapshot_file, (snapshot, job_post) in parsed_snapshots.items():
+        raw_text = snapshot["raw_text"]
+        expected = snapshot["parsed_data"]
 
-            if "title" in expected:
-                total_valid += 1
-                parsed_title = job_post.title
-                expected_title = expected["title"]
+        if "title" in expected:
+            total_valid += 1
+            parsed_title = job_post.title
+            expected_title = expected["title"]
 
-                if parsed_title == expected_title:
-                    print(f"✓ {snapshot_file.name}")
-                    print(f"   Parsed:   '{parsed_title}'")
-                    print(f"   Expected: '{expected_title}'")
-                    print()
-                    good_snapshots.append((snapshot_file.name, expected_title))
-                else:
-                    print(f"✗ {snapshot_file.name}")
-                    print(f"   Parsed:   '{parsed_title}'")
-                    print(f"   Expected: '{expected_title}'")
-                    print(f"   Raw text preview: {raw_text[:200]}")
-                    print()
+            if parsed_title == expected_title:
+                print(f"✓ {snapshot_file.name}")
+                print(f"   Parsed:   '{parsed_title}'")
+                print(f"   Expected: '{expected_title}'")
+                print()
+                good_snapshots.append((snapshot_file.name, expected_title))
+            else:
+                print(f"✗ {snapshot_file.name}")
+                print(f"   Parsed:   '{parsed_title}'")
+                print(f"   Expected: '{expected_title}'")
+                print(f"   Raw text preview: {raw_text[:200]}")
+                print()
 
     # Print summary of good snapshots
     if good_snapshots:
@@ -0,0 +1,46 @@
+import json
+import pytest
+from ..utils.dir_cache import list_snapshot_names
+from ..utils.conversion_analyzer import analyze_all_snapshots
+from ..utils.snapshot_format_detector import detect_formats
+from ..utils.snapshot_cleanup import SnapshotCleaner
+from ..utils.cleanup_snapshots import delete_imperfect_snapshots
+
+def test_list_snapshot_names(tmp_path):
+    (tmp_path / "linkedin_snapshot_20240101_000001.json").write_text("{}")
+    (tmp_path / "linkedin_snapshot_20240101_000002.json.bak").write_text("{}")
+    (tmp_path / "other.json").write_text("{}")
+    (tmp_path / "linkedin_snapshot_dir.json").mkdir()
+    assert list_snapshot_names(tmp_path) == ("linkedin_snapshot_20240101_000001.json",)
+
+def test_missing_snapshots_dir(tmp_path):
+    missing = tmp_path / "snapshots" / "v3"
+    assert list_snapshot_names(missing) == ()
+    
+    # The snapshot tools report nothing instead of crashing
+    analyze_all_snapshots(missing)
+    assert detect_formats(missing) == {}
+    SnapshotCleaner(missing).cleanup_all(dry_run=False)
+    delete_imperfect_snapshots(missing, dry_run=False)
+
+def test_cleanup_all_keeps_backup(tmp_path):
+    snapshot = tmp_path / "linkedin_snapshot_20240101_000001.json"
+    original = '{"raw_text": "Skip to main content\\nDevOps Manager\\nAcme"}'
+    snapshot.write_text(original)
+    
+    SnapshotCleaner(tmp_path).cleanup_all(dry_run=False)
+    
+    assert (tmp_path / "linkedin_snapshot_20240101_000001.json.bak").read_text() == original
+    assert not (tmp_path / "linkedin_snapshot_20240101_000001.json.tmp").exists()
+    assert json.loads(snapshot.read_text())["raw_text"] == "DevOps Manager\nAcme"
+
+@pytest.mark.parametrize("raw_text, expected", [
+    ("Find Jobs", ""),
+    ("  Search x", ""),
+    ("notification\ttotal", ""),
+    ("Keep\n   \n\t\nThis", "Keep\nThis"),
+    ("A line\r\n \r\nB line\r\n", "A line\nB line"),
+    ("Job Title\n  Acme Corp  \nSenior\tEngineer", "Job Title\nAcme Corp\nSenior\tEngineer"),
+])
+def test_clean_raw_text(raw_text, expected):
+    assert SnapshotCleaner().clean_raw_text(raw_text) == expected
@@ -1,5 +1,5 @@
 import pytest
-from ..utils.validation import validate_job_post, validate_salary_format
+from ..utils.validation import validate_job_post, validate_salary_format, _is_valid_date
 from ..models.job_post import JobPost
 
 def test_salary_validation():
@@ -9,7 +9,9 @@ def test_salary_validation():
     valid_formats = [
         "$130,000 - $300,000",
         "130K-300K",
-        "130000-300000"
+        "130000-300000",
+        "130k - 300k",
+        "$ 130K-$ 300K"
     ]
     for salary in valid_formats:
         assert validate_salary_format(salary)
@@ -19,13 +21,45 @@ def test_salary_validation():
     invalid_formats = [
         "Invalid",
         "100K",
-        "100K+"
+        "100K+",
+        "1,2,3-4",
+        "$120K/yr - $150K/yr",
+        "$$100-200"
     ]
     for salary in invalid_formats:
         assert not validate_salary_format(salary)
         print(f"✓ Rejected invalid salary format: {salary}")
 
+def test_date_applied_validation():
+    print("\nTesting date_applied Validation:")
+    
+    valid_dates = [
+        "10/16/2024",
+        "1/1/2024",
+        "02/29/2024"
+    ]
+    for date in valid_dates:
+        assert _is_valid_date(date)
+        print(f"✓ Accepted valid date: {date}")
+    
+    invalid_dates = [
+        "",
+        "02/29/2023",
+        "13/01/2024",
+        "00/10/2024",
+        "1/1/24",
+        "2024-01-01",
+        "+1/1/2024",
+        "2/ 1/1999",
+        "\u0663/29/2024",
+        "10/16/2024\n"
+    ]
+    for date in invalid_dates:
+        assert not _is_valid_date(date)
+        print(f"✓ Rejected invalid date: {date!r}")
+
 if __name__ == "__main__":
     print("Running Validation Tests...")
     test_salary_validation()
+    test_date_applied_validation()
     print("\nAll validation tests passed! ✓") 
\ No newline at end of file
@@ -4,12 +4,30 @@ from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
 from src.extractors.browser import BrowserExtractor
 import json
 import os
 from src.config import get_chrome_options
 import time
 
+# Collects title, company and dismiss button for every job card in one round trip
+CARD_SUMMARY_SCRIPT = """
+return Array.from(document.querySelectorAll('.job-card-container')).map(card => {
+    const title = card.querySelector('.job-card-list__title');
+    const company = card.querySelector('.job-card-container__company-name');
+    return {
+        title: title ? title.innerText : null,
+        company: company ? company.innerText : null,
+        dismiss: card.querySelector("[aria-label^='Dismiss']")
+    };
+});
+"""
+
+# Seconds to back off after LinkedIn fails to confirm a dismissal
+INITIAL_BACKOFF = 1
+MAX_BACKOFF = 8
+
 def test_basic_extraction(debug=False):
     """Test basic extraction from LinkedIn"""
     try:
@@ -39,25 +57,36 @@ def test_basic_extraction(debug=False):
         )
         
         # Find all job cards
-        job_cards = driver.find_elements(By.CLASS_NAME, "job-card-container")
+        job_cards = driver.execute_script(CARD_SUMMARY_SCRIPT)
         
         print(f"\nFound {len(job_cards)} jobs")
         
         # List and dismiss jobs
+        backoff = INITIAL_BACKOFF
         for i, card in enumerate(job_cards, 1):
             try:
-                title = card.find_element(By.CLASS_NAME, "job-card-list__title").text
-                company = card.find_element(By.CLASS_NAME, "job-card-container__company-name").text
+                title, company = card['title'], card['company']
+                if title is None or company is None:
+                    raise ValueError("Missing title or company")
                 print(f"{i}. {title} at {company}")
                 
-                # Find and click the dismiss button (SVG icon)
-                dismiss_button = card.find_element(By.CSS_SELECTOR, "[aria-label^='Dismiss']")
+                # Click the dismiss button (SVG icon)
+                dismiss_button = card['dismiss']
+                if dismiss_button is None:
+                    raise ValueError("Dismiss button not found")
                 dismiss_button.click()
                 
-                print(f"Dismissed job {i}/{len(job_cards)}")
+                # Wait for LinkedIn to swap the card out; only slow down when it doesn't
+                try:
+                    WebDriverWait(driver, 3).until(EC.staleness_of(dismiss_button))
+                    backoff = INITIAL_BACKOFF
+                except TimeoutException:
+                    if debug:
+                        print(f"No dismissal confirmation for job {i}, backing off {backoff}s")
+                    time.sleep(backoff)
+                    backoff = min(backoff * 2, MAX_BACKOFF)
                 
-                # Small delay to prevent rate limiting
-                time.sleep(1)
+                print(f"Dismissed job {i}/{len(job_cards)}")
                 
             except Exception as e:
                 if debug:
@@ -4,6 +4,15 @@ from selenium.webdriver.common.by import By
 from bs4 import BeautifulSoup
 import json
 
+def _write_json_array(f, items):
+    """Write an iterable of JSON-serializable items as a JSON array, one item at a time"""
+    f.write('[')
+    for i, item in enumerate(items):
+        if i:
+            f.write(', ')
+        json.dump(item, f)
+    f.write(']')
+
 def analyze_page_structure():
     chrome_options = Options()
     chrome_options.add_experimental_option("debuggerAddress", "127.0.0.1:9222")
@@ -13,47 +22,67 @@ def analyze_page_structure():
         
         # Get page source
         page_source = driver.page_source
-        soup = BeautifulSoup(page_source, 'html.parser')
+        soup = BeautifulSoup(page_source, 'lxml')
         
         print("\n=== Page Analysis ===")
         
         # 1. Basic Page Info
         print(f"\nTitle tag: {soup.title.string if soup.title else 'No title found'}")
         
+        # Walk the DOM once, bucketing the tags each section below needs
+        elements_to_check = ('h1', 'h2', 'section', 'div')
+        job_related_terms = ('job', 'title', 'company', 'description', 'requirements')
+        mains = []
+        headers = []
+        sections = []
+        job_related = {elem: [] for elem in elements_to_check}
+        
+        for item in soup.find_all(True):
+            name = item.name
+            if name == 'main':
+                mains.append(item)
+            if name in ('h1', 'h2', 'h3'):
+                headers.append(item)
+            if name == 'section':
+                sections.append(item)
+            if name in job_related:
+                # Check if element or its children contain job-related terms
+                text = item.get_text().lower()
+                class_name = ' '.join(item.get('class', [])).lower()
+                id_name = item.get('id', '').lower()
+                haystack = f"{text}\n{class_name}\n{id_name}"
+                
+                if any(term in haystack for term in job_related_terms):
+                    job_related[name].append((item, text))
+        
         # 2. Main content areas
         print("\nMain content sections:")
-        for main in soup.find_all('main'):
+        for main in mains:
             print(f"Main section ID: {main.get('id', 'No ID')} | Class: {main.get('class', 'No class')}")
         
         # 3. Look for job-specific elements
         print("\nPotential job elements:")
-        elements_to_check = ['h1', 'h2', 'section', 'div']
-        job_related_terms = ['job', 'title', 'company', 'description', 'requirements']
-        
         for elem in elements_to_check:
-            for item in soup.find_all(elem):
-                # Check if element or its children contain job-related terms
-                text = item.get_text().lower()
-                class_name = ' '.join(item.get('class', [])).lower()
-                id_name = item.get('id', '').lower()
-                
-                if any(term in text or term in class_name or term in id_name for term in job_related_terms):
-                    print(f"\nFound relevant {elem}:")
-                    print(f"  Class: {item.get('class', 'No class')}")
-                    print(f"  ID: {item.get('id', 'No ID')}")
-                    print(f"  First 100 chars: {text[:100]}...")
+            for item, text in job_related[elem]:
+                print(f"\nFound relevant {elem}:")
+                print(f"  Class: {item.get('class', 'No class')}")
+                print(f"  ID: {item.get('id', 'No ID')}")
+                print(f"  First 100 chars: {text[:100]}...")
         
         # 4. Save full structure for detailed analysis
+        # Stream each entry to disk rather than building the whole document first
         with open('page_structure.json', 'w') as f:
-            structure = {
-                'url': driver.current_url,
-                'title': soup.title.string if soup.title else None,
-                'headers': [{'tag': h.name, 'class': h.get('class'), 'id': h.get('id'), 'text': h.get_text().strip()} 
-                          for h in soup.find_all(['h1', 'h2', 'h3'])],
-                'main_sections': [{'tag': s.name, 'class': s.get('class'), 'id': s.get('id')} 
-                                for s in soup.find_all('section')]
-            }
-            json.dump(structure, f, indent=2)
+            f.write('{"url": %s, "title": %s, ' % (
+                json.dumps(driver.current_url),
+                json.dumps(soup.title.string if soup.title else None)
+            ))
+            f.write('"headers": ')
+            _write_json_array(f, ({'tag': h.name, 'class': h.get('class'), 'id': h.get('id'), 'text': h.get_text().strip()}
+                                  for h in headers))
+            f.write(', "main_sections": ')
+            _write_json_array(f, ({'tag': s.name, 'class': s.get('class'), 'id': s.get('id')}
+                                  for s in sections))
+            f.write('}\n')
             print("\nDetailed structure saved to 'page_structure.json'")
         
         return True
@@ -2,6 +2,9 @@ import shutil
 from pathlib import Path
 import json
 
+_SNAPSHOTS_ROOT = Path("snapshots")
+_SNAPSHOTS_DIR = _SNAPSHOTS_ROOT / "v3"
+
 def clean_slate():
     """Remove snapshots and problematic tests while preserving working tests"""
     
@@ -15,9 +18,11 @@ def clean_slate():
         "src/tests/test_selectors.py",
         "src/tests/test_validation.py"
     ]
+    preserve_files = {p for p in preserve_tests if not p.endswith('/')}
+    preserve_dirs = tuple(p for p in preserve_tests if p.endswith('/'))
     
     # 1. Remove snapshot directory
-    snapshots_dir = Path("snapshots")
+    snapshots_dir = _SNAPSHOTS_ROOT
     if snapshots_dir.exists():
         shutil.rmtree(snapshots_dir)
         print(f"✓ Removed {snapshots_dir}")
@@ -32,14 +37,15 @@ def clean_slate():
         path = Path(test_file)
         if path.exists():
             # Check if file should be preserved
-            if not any(str(path).startswith(preserve) for preserve in preserve_tests):
+            path_str = str(path)
+            if path_str not in preserve_files and not path_str.startswith(preserve_dirs):
                 path.unlink()
                 print(f"✓ Removed {path}")
             else:
                 print(f"✓ Preserved {path}")
     
     # 3. Create clean snapshots directory
-    new_snapshots_dir = Path("snapshots/v3")
+    new_snapshots_dir = _SNAPSHOTS_DIR
     new_snapshots_dir.mkdir(parents=True, exist_ok=True)
     print(f"✓ Created clean snapshots directory: {new_snapshots_dir}")
     
@@ -73,7 +79,7 @@ def clean_slate():
     }
     
     # Save sample snapshots
-    snapshots_dir = Path("snapshots/v3")
+    snapshots_dir = _SNAPSHOTS_DIR
     snapshots_dir.mkdir(parents=True, exist_ok=True)
     
     for snapshot_id, data in sample_snapshots.items():
@@ -1,36 +1,56 @@
 import json
+import os
 import shutil
+import subprocess
+import sys
 from pathlib import Path
 from datetime import datetime
-from typing import Set, Dict
+from typing import FrozenSet, Dict, Union
+from .dir_cache import list_snapshot_names
 
-def backup_snapshots(snapshots_dir: str = "snapshots/v3") -> Path:
+_SNAPSHOTS_DIR = Path("snapshots/v3")
+_CLEAN_SNAPSHOTS = frozenset((
+    'linkedin_snapshot_20241106_132718.json',
+    'linkedin_snapshot_20241116_112810.json',
+    'linkedin_snapshot_20241118_144214.json',
+    'linkedin_snapshot_20241106_132813.json'
+))
+
+def backup_snapshots(snapshots_dir: Union[str, Path] = _SNAPSHOTS_DIR) -> Path:
     """Create a backup of all snapshots before deletion"""
     source_path = Path(snapshots_dir)
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     backup_path = source_path.parent / f"backup_{timestamp}"
     
-    shutil.copytree(source_path, backup_path)
+    if not _clone_tree(source_path, backup_path):
+        shutil.rmtree(backup_path, ignore_errors=True)
+        shutil.copytree(source_path, backup_path)
     print(f"Created backup at: {backup_path}")
     return backup_path
 
-def get_clean_snapshots() -> Set[str]:
+def _clone_tree(source_path: Path, backup_path: Path) -> bool:
+    """Copy a directory with copy-on-write clones where the filesystem supports them"""
+    # APFS clonefile on macOS; btrfs/XFS reflinks elsewhere, with cp falling back itself.
+    # -p keeps mtimes and modes, matching the copy2 used by shutil.copytree
+    clone_flag = '-c' if sys.platform == 'darwin' else '--reflink=auto'
+    try:
+        subprocess.run(['cp', clone_flag, '-p', '-R', str(source_path), str(backup_path)],
+                       check=True, capture_output=True)
+    except (OSError, subprocess.CalledProcessError):
+        return False
+    return True
+
+def get_clean_snapshots() -> FrozenSet[str]:
     """Return set of known clean snapshot filenames"""
-    return {
-        'linkedin_snapshot_20241106_132718.json',
-        'linkedin_snapshot_20241116_112810.json',
-        'linkedin_snapshot_20241118_144214.json',
-        'linkedin_snapshot_20241106_132813.json'
-    }
+    return _CLEAN_SNAPSHOTS
 
-def delete_imperfect_snapshots(snapshots_dir: str = "snapshots/v3", dry_run: bool = True) -> None:
+def delete_imperfect_snapshots(snapshots_dir: Union[str, Path] = _SNAPSHOTS_DIR, dry_run: bool = True) -> None:
     """Delete all snapshots except the perfect ones"""
-    path = Path(snapshots_dir)
     clean_snapshots = get_clean_snapshots()
     
     # Count snapshots
-    all_snapshots = list(path.glob("linkedin_snapshot_*.json"))
-    to_delete = [f for f in all_snapshots if f.name not in clean_snapshots]
+    all_snapshots = list_snapshot_names(snapshots_dir)
+    to_delete = [name for name in all_snapshots if name not in clean_snapshots]
     
     print(f"\nFound {len(all_snapshots)} total snapshots")
     print(f"Clean snapshots: {len(clean_snapshots)}")
@@ -39,15 +59,15 @@ def delete_imperfect_snapshots(snapshots_dir: str = "snapshots/v3", dry_run: boo
     if dry_run:
         print("\nDRY RUN - No files will be deleted")
         print("\nWould delete:")
-        for file in to_delete[:5]:
-            print(f"- {file.name}")
+        for name in to_delete[:5]:
+            print(f"- {name}")
         if len(to_delete) > 5:
             print(f"... and {len(to_delete) - 5} more")
     else:
         print("\nDeleting imperfect snapshots...")
-        for file in to_delete:
-            file.unlink()
-            print(f"Deleted: {file.name}")
+        for name in to_delete:
+            os.unlink(os.path.join(snapshots_dir, name))
+            print(f"Deleted: {name}")
             
         print(f"\nDeletion complete. Kept {len(clean_snapshots)} clean snapshots.")
 
@@ -66,4 +86,4 @@ if __name__ == "__main__":
     
     if not args.apply:
         print("\nTo actually delete files, run:")
-        print("python src/utils/cleanup_snapshots.py --apply") 
\ No newline at end of file
+        print("python -m src.utils.cleanup_snapshots --apply") 
\ No newline at end of file
@@ -1,11 +1,13 @@
-import csv
+import sys
 import pyperclip
-from io import StringIO
 from typing import Optional
 from ..models.job_post import JobPost
 from ..parser.formatters import format_csv_row
 from .validation import is_csv_data
 
+# macOS general pasteboard, looked up once; False when AppKit is unavailable
+_pasteboard = None
+
 def get_clipboard_content() -> str:
     """
     Get and validate clipboard content.
@@ -25,4 +27,21 @@ def set_clipboard_content(job_post: JobPost) -> None:
     # Format the job post as CSV
     csv_row = format_csv_row(job_post)
     # Copy to clipboard
-    pyperclip.copy(csv_row)
+    _copy(csv_row)
+
+def _copy(text: str) -> None:
+    """Copy text via NSPasteboard on macOS, avoiding a pbcopy fork per call"""
+    global _pasteboard
+    if sys.platform == 'darwin':
+        if _pasteboard is None:
+            try:
+                from AppKit import NSPasteboard
+            except ImportError:
+                _pasteboard = False
+            else:
+                _pasteboard = NSPasteboard.generalPasteboard()
+        if _pasteboard:
+            _pasteboard.clearContents()
+            _pasteboard.setString_forType_(text, 'public.utf8-plain-text')
+            return
+    pyperclip.copy(text)
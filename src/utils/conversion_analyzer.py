@@ -1,7 +1,19 @@
 from pathlib import Path
-import json
-from typing import Dict, List, Tuple
+import math
+import os
+import re
+from typing import Dict, List, Tuple, Union
 from dataclasses import dataclass
+from .dir_cache import list_snapshot_names
+from .parallel import map_snapshots
+from .json_io import load_json
+
+_SNAPSHOTS_DIR = Path("snapshots/v3")
+
+# Single-pass matchers for the content checks below
+_JOB_INDICATORS = re.compile(r'experience|skills|qualifications|about|responsibilities', re.IGNORECASE)
+_NAV_CONTENT = re.compile(r'notifications total|Skip to search|Skip to main')
+_CORRUPTED_VALUE = re.compile(r'skip to|notifications', re.IGNORECASE)
 
 @dataclass
 class ConversionConfidence:
@@ -10,30 +22,23 @@ class ConversionConfidence:
     missing_data: List[str]
     reasons: List[str]
 
-def analyze_conversion_confidence(snapshot_file: Path) -> ConversionConfidence:
+def analyze_conversion_confidence(snapshot_file: Union[str, Path]) -> ConversionConfidence:
     """Analyze if a Format 1 snapshot can be converted to Format 2"""
     try:
-        with open(snapshot_file) as f:
-            data = json.load(f)
+        data = load_json(snapshot_file)
             
-        reasons = []
+        # Each issue carries its confidence factor; the score is their product
+        issues: List[Tuple[str, float]] = []
         missing = []
-        confidence = 1.0
         
         # Check if raw_text contains actual job content
         raw_text = data.get('raw_text', '')
-        job_indicators = ['experience', 'skills', 'qualifications', 'about', 'responsibilities']
-        has_job_content = any(ind in raw_text.lower() for ind in job_indicators)
-        
-        if not has_job_content:
-            reasons.append("No job-related content found in raw_text")
-            confidence *= 0.3
+        if not _JOB_INDICATORS.search(raw_text):
+            issues.append(("No job-related content found in raw_text", 0.3))
             
         # Check for navigation content
-        nav_content = ['notifications total', 'Skip to search', 'Skip to main']
-        if any(nav in raw_text for nav in nav_content):
-            reasons.append("Contains navigation content")
-            confidence *= 0.7
+        if _NAV_CONTENT.search(raw_text):
+            issues.append(("Contains navigation content", 0.7))
             
         parsed = data.get('parsed_data', {})
         
@@ -48,12 +53,13 @@ def analyze_conversion_confidence(snapshot_file: Path) -> ConversionConfidence:
             value = parsed.get(field, '')
             if not value:
                 missing.append(field)
-                reasons.append(f"Missing {desc}")
-                confidence *= 0.5
-            elif any(nav in value.lower() for nav in ['skip to', 'notifications']):
-                reasons.append(f"Corrupted {desc}")
-                confidence *= 0.4
+                issues.append((f"Missing {desc}", 0.5))
+            elif _CORRUPTED_VALUE.search(value):
+                issues.append((f"Corrupted {desc}", 0.4))
                 
+        confidence = math.prod((factor for _, factor in issues), start=1.0)
+        reasons = [reason for reason, _ in issues]
+        
         # Overall assessment
         can_convert = confidence > 0.3  # Threshold for attempted conversion
         
@@ -72,18 +78,19 @@ def analyze_conversion_confidence(snapshot_file: Path) -> ConversionConfidence:
             reasons=[f"Error analyzing file: {str(e)}"]
         )
 
-def analyze_all_snapshots(snapshots_dir: str = "snapshots/v3") -> None:
+def analyze_all_snapshots(snapshots_dir: Union[str, Path] = _SNAPSHOTS_DIR) -> None:
     """Analyze conversion confidence for all snapshots"""
-    path = Path(snapshots_dir)
     results = {
         'convertible': [],
         'risky': [],
         'not_convertible': []
     }
     
-    for snapshot_file in path.glob("linkedin_snapshot_*.json"):
-        confidence = analyze_conversion_confidence(snapshot_file)
-        
+    names = list_snapshot_names(snapshots_dir)
+    paths = [os.path.join(snapshots_dir, name) for name in names]
+    confidences = map_snapshots(analyze_conversion_confidence, paths)
+    
+    for name, confidence in zip(names, confidences):
         if confidence.confidence > 0.7:
             category = 'convertible'
         elif confidence.confidence > 0.3:
@@ -91,7 +98,7 @@ def analyze_all_snapshots(snapshots_dir: str = "snapshots/v3") -> None:
         else:
             category = 'not_convertible'
             
-        results[category].append((snapshot_file.name, confidence))
+        results[category].append((name, confidence))
     
     # Print report
     print("\nSnapshot Conversion Analysis")
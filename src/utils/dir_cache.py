@@ -0,0 +1,27 @@
+import os
+from functools import lru_cache
+from typing import Tuple, Union
+
+SNAPSHOT_PREFIX = "linkedin_snapshot_"
+SNAPSHOT_SUFFIX = ".json"
+
+@lru_cache(maxsize=32)
+def _list_snapshot_names(snapshots_dir: str, mtime_ns: int) -> Tuple[str, ...]:
+    """Scan a directory once for snapshot files; mtime_ns only keys the cache"""
+    with os.scandir(snapshots_dir) as it:
+        return tuple(e.name for e in it if e.is_file(follow_symlinks=False)
+                     and e.name.startswith(SNAPSHOT_PREFIX) and e.name.endswith(SNAPSHOT_SUFFIX))
+
+def list_snapshot_names(snapshots_dir: Union[str, os.PathLike]) -> Tuple[str, ...]:
+    """Return snapshot file names in a directory, cached until the directory changes.
+
+    Adding, removing or renaming a file bumps the directory's mtime, which
+    invalidates the cached listing. Edits to existing files don't, and don't
+    need to since only names are cached. A missing directory lists as empty.
+    """
+    snapshots_dir = os.fspath(snapshots_dir)
+    try:
+        return _list_snapshot_names(snapshots_dir, os.stat(snapshots_dir).st_mtime_ns)
+    except FileNotFoundError:
+        return ()
+
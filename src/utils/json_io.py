@@ -0,0 +1,22 @@
+import json
+from typing import Any, Union
+import os
+
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is the fallback
+    orjson = None
+
+def load_json(path: Union[str, os.PathLike]) -> Any:
+    """Read and parse a JSON file"""
+    with open(path, 'rb') as f:
+        raw = f.read()
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+def encode_json(data: Any) -> bytes:
+    """Serialize data to JSON bytes with 2-space indentation"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode()
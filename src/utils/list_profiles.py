@@ -1,7 +1,14 @@
-import json
 import os
+from functools import lru_cache
+import ijson
 from src.config import get_chrome_options
 
+@lru_cache(maxsize=None)
+def _read_profile_cache(local_state_path: str) -> dict:
+    """Stream just profile.info_cache out of Chrome's Local State file"""
+    with open(local_state_path, 'rb') as f:
+        return dict(ijson.kvitems(f, 'profile.info_cache', use_float=True))
+
 def list_chrome_profiles():
     """List all available Chrome profiles and their debugging ports"""
     
@@ -10,12 +17,8 @@ def list_chrome_profiles():
     local_state_path = os.path.join(chrome_dir, "Local State")
     
     try:
-        # Read Chrome's Local State file
-        with open(local_state_path, 'r') as f:
-            local_state = json.load(f)
-            
-        # Get profile information
-        profiles = local_state.get('profile', {}).get('info_cache', {})
+        # Read profile information from Chrome's Local State file
+        profiles = _read_profile_cache(local_state_path)
         
         print("\nAvailable Chrome Profiles:")
         print("-" * 50)
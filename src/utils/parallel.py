@@ -0,0 +1,15 @@
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, List, Sequence, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Below this many files, worker start-up costs more than parsing serially
+PARALLEL_MIN_FILES = 64
+
+def map_snapshots(func: Callable[[T], R], items: Sequence[T], chunksize: int = 32) -> List[R]:
+    """Apply func to each item in order, across processes for large directories"""
+    if len(items) < PARALLEL_MIN_FILES:
+        return [func(item) for item in items]
+    with ProcessPoolExecutor() as executor:
+        return list(executor.map(func, items, chunksize=chunksize))
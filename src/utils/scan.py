@@ -4,27 +4,35 @@ import re
 def find_chrome_debug_ports():
     debug_instances = []
     
-    for proc in psutil.process_iter(['pid', 'name', 'cmdline']):
+    # Only name/pid up front; cmdline is read just for chrome processes below
+    for proc in psutil.process_iter(['pid', 'name']):
+        name = proc.info['name']
+        if not name or 'chrome' not in name.lower():
+            continue
         try:
-            if proc.info['name'] and 'chrome' in proc.info['name'].lower():
-                cmdline = proc.info['cmdline']
-                if cmdline:
-                    # Look for --remote-debugging-port argument
-                    for i, arg in enumerate(cmdline):
-                        if '--remote-debugging-port' in arg:
-                            # Extract port number using regex
-                            if '=' in arg:
-                                port = arg.split('=')[1]
-                            else:
-                                # Check next argument for port number
-                                port = cmdline[i + 1]
-                            debug_instances.append({
-                                'pid': proc.info['pid'],
-                                'port': port,
-                                'command': ' '.join(cmdline)
-                            })
+            cmdline = proc.cmdline()
         except (psutil.NoSuchProcess, psutil.AccessDenied):
             continue
+        if not cmdline or not any('--remote-debugging-port' in arg for arg in cmdline):
+            continue
+        
+        command = None
+        # Look for --remote-debugging-port argument
+        for i, arg in enumerate(cmdline):
+            if '--remote-debugging-port' in arg:
+                # Extract port number using regex
+                if '=' in arg:
+                    port = arg.split('=')[1]
+                else:
+                    # Check next argument for port number
+                    port = cmdline[i + 1]
+                if command is None:
+                    command = ' '.join(cmdline)
+                debug_instances.append({
+                    'pid': proc.info['pid'],
+                    'port': port,
+                    'command': command
+                })
     
     return debug_instances
 
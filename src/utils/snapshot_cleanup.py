@@ -1,54 +1,56 @@
 import json
+import os
+import shutil
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple, Union
 import re
+from .dir_cache import list_snapshot_names
+from .parallel import map_snapshots
+from .json_io import encode_json, load_json
+
+_SNAPSHOTS_DIR = Path("snapshots/v3")
 
 class SnapshotCleaner:
-    def __init__(self, snapshots_dir: str = "snapshots/v3"):
+    # One kept line of raw text, captured without surrounding whitespace.
+    # Blank lines and navigation/chrome lines never match, so a single
+    # finditer over the whole text replaces a split/strip/search loop.
+    LINE_PATTERN = re.compile(
+        r'^[^\S\n]*'
+        r'(?!Search)'
+        r'(?![^\n]*?(?:notifications?[^\S\n]+total'
+        r'|Skip to'
+        r'|Keyboard shortcuts'
+        r'|My Network'
+        r'|Messaging'
+        r'|new feed updates))'
+        r'(?![^\n]*?(?:Home|Jobs)[^\S\n]*$)'
+        r'(\S[^\n]*?)[^\S\n]*$',
+        re.I | re.M
+    )
+
+    # Basic extraction patterns
+    FIELD_PATTERNS = {
+        'title': re.compile(r'^([^•\n]+?)(?:\s+at|\s+•|\s+in|\s+\(|$)'),
+        'company': re.compile(r'(?:at\s+)?([^•\n]+?)\s+(?:•|$)'),
+        'location': re.compile(r'(?:•\s*)?([^•\n]+?,\s*(?:[A-Z]{2}|[A-Za-z]+))\s*(?:•|$)'),
+    }
+
+    def __init__(self, snapshots_dir: Union[str, Path] = _SNAPSHOTS_DIR):
         self.snapshots_dir = Path(snapshots_dir)
         
     def clean_raw_text(self, raw_text: str) -> str:
         """Remove navigation and irrelevant content from raw text"""
-        # Split into lines and filter out navigation
-        lines = raw_text.split('\n')
-        cleaned_lines = []
-        
-        skip_patterns = [
-            r'notifications?\s+total',
-            r'Skip to',
-            r'Keyboard shortcuts',
-            r'My Network',
-            r'Messaging',
-            r'Home$',
-            r'Jobs$',
-            r'^Search',
-            r'new feed updates'
-        ]
-        
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-            if any(re.search(pattern, line, re.I) for pattern in skip_patterns):
-                continue
-            cleaned_lines.append(line)
-            
-        return '\n'.join(cleaned_lines)
+        return '\n'.join(m.group(1) for m in self.LINE_PATTERN.finditer(raw_text))
     
     def extract_job_data(self, raw_text: str) -> Dict[str, str]:
-        """Extract structured job data from cleaned text"""
-        cleaned_text = self.clean_raw_text(raw_text)
-        
-        # Basic extraction patterns
-        patterns = {
-            'title': r'^([^•\n]+?)(?:\s+at|\s+•|\s+in|\s+\(|$)',
-            'company': r'(?:at\s+)?([^•\n]+?)\s+(?:•|$)',
-            'location': r'(?:•\s*)?([^•\n]+?,\s*(?:[A-Z]{2}|[A-Za-z]+))\s*(?:•|$)',
-        }
-        
+        """Extract structured job data from raw text"""
+        return self.extract_job_data_from_cleaned(self.clean_raw_text(raw_text))
+    
+    def extract_job_data_from_cleaned(self, cleaned_text: str) -> Dict[str, str]:
+        """Extract structured job data from text already passed through clean_raw_text"""
         data = {}
-        for field, pattern in patterns.items():
-            match = re.search(pattern, cleaned_text)
+        for field, pattern in self.FIELD_PATTERNS.items():
+            match = pattern.search(cleaned_text)
             if match:
                 data[field] = match.group(1).strip()
         
@@ -56,35 +58,46 @@ class SnapshotCleaner:
     
     def cleanup_snapshot(self, snapshot_file: Path) -> Optional[Dict]:
         """Clean up a single snapshot file"""
+        cleaned, error = self._cleanup_snapshot(snapshot_file)
+        if error:
+            print(error)
+        return cleaned
+    
+    def _cleanup_snapshot(self, snapshot_file: Path) -> Tuple[Optional[Dict], Optional[str]]:
+        """Clean up a single snapshot file, returning the error instead of printing it"""
         try:
-            with open(snapshot_file) as f:
-                data = json.load(f)
+            data = load_json(snapshot_file)
             
             if 'raw_text' not in data:
-                print(f"Missing raw_text in {snapshot_file.name}")
-                return None
+                return None, f"Missing raw_text in {snapshot_file.name}"
                 
-            # Extract clean data
-            job_data = self.extract_job_data(data['raw_text'])
+            # Clean once; extraction reuses the cleaned text
+            cleaned_text = self.clean_raw_text(data['raw_text'])
+            job_data = self.extract_job_data_from_cleaned(cleaned_text)
             
             # Create cleaned snapshot
             cleaned = {
-                'raw_text': self.clean_raw_text(data['raw_text']),
+                'raw_text': cleaned_text,
                 'parsed_data': job_data
             }
             
-            return cleaned
+            return cleaned, None
             
         except Exception as e:
-            print(f"Error processing {snapshot_file.name}: {str(e)}")
-            return None
+            return None, f"Error processing {snapshot_file.name}: {str(e)}"
     
     def cleanup_all(self, dry_run: bool = True) -> None:
         """Clean up all snapshots in directory"""
-        for snapshot_file in self.snapshots_dir.glob("linkedin_snapshot_*.json"):
-            print(f"\nProcessing: {snapshot_file.name}")
+        # Parsing fans out to worker processes; output and writes stay in order here
+        names = list_snapshot_names(self.snapshots_dir)
+        results = map_snapshots(self._cleanup_snapshot, [self.snapshots_dir / name for name in names])
+        written = False
+        for name, (cleaned, error) in zip(names, results):
+            snapshot_file = self.snapshots_dir / name
+            print(f"\nProcessing: {name}")
             
-            cleaned = self.cleanup_snapshot(snapshot_file)
+            if error:
+                print(error)
             if not cleaned:
                 continue
                 
@@ -92,12 +105,30 @@ class SnapshotCleaner:
                 print("Would write cleaned data:")
                 print(json.dumps(cleaned, indent=2))
             else:
+                # Write and sync a sibling temp file, back up the original alongside
+                # it, then swap in the new content with a single atomic replace
+                tmp_file = snapshot_file.with_suffix('.json.tmp')
+                with open(tmp_file, 'wb') as f:
+                    f.write(encode_json(cleaned))
+                    f.flush()
+                    os.fsync(f.fileno())
                 backup_file = snapshot_file.with_suffix('.json.bak')
-                snapshot_file.rename(backup_file)
-                
-                with open(snapshot_file, 'w') as f:
-                    json.dump(cleaned, f, indent=2)
+                backup_file.unlink(missing_ok=True)
+                try:
+                    os.link(snapshot_file, backup_file)
+                except OSError:
+                    shutil.copy2(snapshot_file, backup_file)
+                os.replace(tmp_file, snapshot_file)
+                written = True
                 print(f"Cleaned and saved: {snapshot_file.name}")
+        
+        if written:
+            # Persist the batch of renames with one directory sync
+            dir_fd = os.open(self.snapshots_dir, os.O_RDONLY)
+            try:
+                os.fsync(dir_fd)
+            finally:
+                os.close(dir_fd)
 
 if __name__ == "__main__":
     import argparse
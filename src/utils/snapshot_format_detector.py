@@ -1,8 +1,16 @@
-import json
+import os
 from pathlib import Path
-from typing import Dict, List, Set
+from typing import Dict, List, Set, Tuple, Union
 from dataclasses import dataclass
 from collections import defaultdict
+import ijson
+from .dir_cache import list_snapshot_names
+from .json_io import encode_json, load_json
+
+_SNAPSHOTS_DIR = Path("snapshots/v3")
+
+# Sorted (key, type) pairs; hashable, so it keys the formats dict directly
+FormatSignature = Tuple[Tuple[str, str], ...]
 
 @dataclass
 class FormatInfo:
@@ -10,8 +18,9 @@ class FormatInfo:
     files: List[str]
     fields: Set[str]
     sample_structure: Dict
+    sample_json: str = ''
 
-def detect_formats(snapshots_dir: str = "snapshots/v3") -> Dict[str, FormatInfo]:
+def detect_formats(snapshots_dir: Union[str, Path] = _SNAPSHOTS_DIR) -> Dict[FormatSignature, FormatInfo]:
     """Analyze all snapshots to detect different formats"""
     formats = defaultdict(lambda: FormatInfo(
         format_type="unknown",
@@ -20,52 +29,83 @@ def detect_formats(snapshots_dir: str = "snapshots/v3") -> Dict[str, FormatInfo]
         sample_structure={}
     ))
     
-    path = Path(snapshots_dir)
-    
-    for snapshot_file in path.glob("linkedin_snapshot_*.json"):
+    for name in list_snapshot_names(snapshots_dir):
+        snapshot_path = os.path.join(snapshots_dir, name)
         try:
-            with open(snapshot_file) as f:
-                data = json.load(f)
-                
             # Create format signature based on keys and data types
-            format_sig = _create_format_signature(data)
+            field_types = _read_field_types(snapshot_path)
+            format_sig = _create_format_signature(field_types)
             
             # Update format info
             format_info = formats[format_sig]
-            format_info.files.append(snapshot_file.name)
-            format_info.fields.update(data.keys())
+            format_info.files.append(name)
+            format_info.fields.update(field_types.keys())
             
-            # Store first occurrence as sample
+            # Store first occurrence as sample; only these files are fully loaded
             if not format_info.sample_structure:
+                data = load_json(snapshot_path)
                 format_info.sample_structure = _simplify_structure(data)
+                format_info.sample_json = encode_json(format_info.sample_structure).decode()
                 format_info.format_type = _detect_format_type(data)
                 
         except Exception as e:
-            print(f"Error processing {snapshot_file.name}: {str(e)}")
+            print(f"Error processing {name}: {str(e)}")
             
     return formats
 
-def _create_format_signature(data: Dict) -> str:
-    """Create a signature string representing the data format"""
-    def get_type_sig(value):
-        if isinstance(value, dict):
-            return f"dict({','.join(sorted(value.keys()))})"
-        return type(value).__name__
+def _read_field_types(snapshot_path: str) -> Dict[str, str]:
+    """Stream a snapshot and map each top-level key to its type signature.
+    
+    Dict values are described by their sorted keys, e.g. "dict(company,title)";
+    everything below that level is skipped without building Python objects.
+    """
+    field_types = {}
+    sub_keys = {}
+    depth = 0
+    key = None
     
-    fields = sorted(f"{k}:{get_type_sig(v)}" for k, v in data.items())
-    return "|".join(fields)
+    with open(snapshot_path, 'rb') as f:
+        for _, event, value in ijson.parse(f, use_float=True):
+            if event in ('start_map', 'start_array'):
+                if depth == 1:
+                    if event == 'start_map':
+                        sub_keys[key] = []
+                    else:
+                        field_types[key] = 'list'
+                depth += 1
+            elif event in ('end_map', 'end_array'):
+                depth -= 1
+            elif event == 'map_key':
+                if depth == 1:
+                    key = value
+                elif depth == 2 and key in sub_keys:
+                    sub_keys[key].append(value)
+            elif depth == 1:
+                field_types[key] = type(value).__name__
+    
+    for key, keys in sub_keys.items():
+        field_types[key] = f"dict({','.join(sorted(keys))})"
+    return field_types
+
+def _create_format_signature(field_types: Dict[str, str]) -> FormatSignature:
+    """Create a hashable (key, type) signature representing the data format"""
+    return tuple(sorted(field_types.items()))
 
 def _simplify_structure(data: Dict, max_depth: int = 3) -> Dict:
     """Create a simplified version of the data structure"""
     if max_depth <= 0:
         return "..."
         
+    # Strings are the common (and largest) leaves, so test them first
+    if isinstance(data, str):
+        return data[:50] + ('...' if len(data) > 50 else '')
     if isinstance(data, dict):
+        if max_depth == 1:
+            # Every child would collapse to "..." anyway
+            return dict.fromkeys(data, "...")
         return {k: _simplify_structure(v, max_depth - 1) for k, v in data.items()}
     if isinstance(data, (list, set)):
         return [_simplify_structure(next(iter(data)), max_depth - 1)] if data else []
-    if isinstance(data, str):
-        return f"{data[:50]}..." if len(data) > 50 else data
     return data
 
 def _detect_format_type(data: Dict) -> str:
@@ -78,7 +118,7 @@ def _detect_format_type(data: Dict) -> str:
         return "api_response"
     return "unknown"
 
-def print_format_report(formats: Dict[str, FormatInfo]) -> None:
+def print_format_report(formats: Dict[FormatSignature, FormatInfo]) -> None:
     """Print a detailed report of detected formats"""
     print("\nSnapshot Format Analysis")
     print("=" * 50)
@@ -88,7 +128,7 @@ def print_format_report(formats: Dict[str, FormatInfo]) -> None:
         print(f"Files: {len(info.files)}")
         print(f"Fields: {', '.join(sorted(info.fields))}")
         print("\nSample Structure:")
-        print(json.dumps(info.sample_structure, indent=2))
+        print(info.sample_json)
         print("\nAffected Files:")
         for file in info.files[:5]:  # Show first 5 files
             print(f"- {file}")
@@ -1,109 +1,132 @@
 from datetime import datetime
+from functools import lru_cache
 from typing import List
 from ..models.job_post import JobPost
 import re
 from ..parser.constants import LocationPatterns
 
+# Feeds repeat the same few locations; the lookup scans every state/territory name
+_is_us_location = lru_cache(maxsize=4096)(LocationPatterns.is_us_location)
+_DATE_RE = re.compile(r'\d{1,2}/\d{1,2}/\d{4}')
+_MDY_RE = re.compile(r'(\d{1,2})/(\d{1,2})/(\d{4})', re.ASCII)
+_HYBRID_RE = re.compile(r'(hybrid)|on-?site', re.IGNORECASE)
+_DIGITS = frozenset('0123456789')
+_INVALID_SENTINELS = frozenset(('', None, 'Unknown'))
+_POSTED_RE = re.compile(r'hour|day|week|month|ago', re.IGNORECASE)
+_SALARY_RE = re.compile(
+    r'\$?\s*(?:\d{1,3}(?:,\d{3})*|\d+)\s*[Kk]?'
+    r'\s*-\s*'
+    r'\$?\s*(?:\d{1,3}(?:,\d{3})*|\d+)\s*[Kk]?\s*'
+)
+
 def validate_job_post(job_post: JobPost) -> List[str]:
     """Comprehensive validation of job post data."""
     errors = []
+    company = job_post.company
+    title = job_post.title
+    location = job_post.location or ''
+    salary = job_post.salary
+    posted = job_post.posted
     
     # Required fields validation
-    if not job_post.company or job_post.company == "Unknown":
+    if company in _INVALID_SENTINELS:
         errors.append("Missing or invalid company name")
     
-    if not job_post.title or job_post.title == "Unknown":
+    if title in _INVALID_SENTINELS:
         errors.append("Missing or invalid job title")
     
     # Location validation
-    if not job_post.location:
+    if not location:
         errors.append("Missing location")
-    elif not LocationPatterns.is_us_location(job_post.location):
+    elif not _is_us_location(location):
         errors.append("Location does not appear to be in United States")
     
     # Remote validation
-    if "remote" in job_post.location.lower():
-        if "hybrid" in job_post.raw_text.lower():
+    if "remote" in location.lower():
+        # One case-insensitive pass over raw_text, stopping once both kinds are seen
+        hybrid = onsite = False
+        for match in _HYBRID_RE.finditer(job_post.raw_text or ''):
+            if match.group(1):
+                hybrid = True
+            else:
+                onsite = True
+            if hybrid and onsite:
+                break
+        if hybrid:
             errors.append("Job claims remote but mentions hybrid work")
-        if "on-site" in job_post.raw_text.lower() or "onsite" in job_post.raw_text.lower():
+        if onsite:
             errors.append("Job claims remote but mentions on-site work")
 
     # Salary validation
-    if job_post.salary:
-        if not any(char.isdigit() for char in job_post.salary):
+    if salary:
+        if _DIGITS.isdisjoint(salary):
             errors.append("Salary format appears invalid")
-        if job_post.salary.count('-') != 1 and 'K' in job_post.salary:
+        if salary.count('-') != 1 and 'K' in salary:
             errors.append("Salary range format appears invalid")
     
     # Date validation - only check date_applied since it's always today's date
-    try:
-        datetime.strptime(job_post.date_applied, "%m/%d/%Y")
-    except ValueError:
+    if not _is_valid_date(job_post.date_applied):
         errors.append("Invalid date_applied format (should be MM/DD/YYYY)")
     
     # Posted date validation - allow relative dates
-    if job_post.posted and not any(word in job_post.posted.lower() 
-                                  for word in ['hour', 'day', 'week', 'month', 'ago']):
+    if posted and not _POSTED_RE.search(posted):
         errors.append("Invalid posted date format")
     
     return errors
 
-def validate_salary_format(salary: str) -> bool:
-    """Validate salary string format."""
-    if not salary:
-        return True  # Empty salary is allowed
-        
-    # Remove common salary formatting
-    clean_salary = salary.replace('$', '').replace(',', '').replace(' ', '')
-    
-    # Check for range format (e.g., "130000-300000" or "130K-300K")
-    parts = clean_salary.split('-')
-    if len(parts) != 2:
+def _is_valid_date(value: str) -> bool:
+    """Check for a real MM/DD/YYYY date without going through strptime."""
+    match = _MDY_RE.fullmatch(value)
+    if not match:
+        return False
+    month, day, year = map(int, match.groups())
+    try:
+        # datetime() rejects impossible dates such as 02/30/2024, as strptime did
+        datetime(year, month, day)
+    except ValueError:
         return False
-        
-    # Validate each part
-    for part in parts:
-        part = part.upper()
-        if 'K' in part:
-            part = part.replace('K', '000')
-        if not part.replace('000', '').isdigit():
-            return False
-    
     return True
 
+def validate_salary_format(salary: str) -> bool:
+    """Validate salary string format."""
+    # Empty salary is allowed; otherwise a range like "130000-300000", "130K-300K"
+    # or "$130,000 - $300,000"
+    return not salary or _SALARY_RE.fullmatch(salary) is not None
+
 def is_csv_data(content: str) -> bool:
     """Check if content appears to be CSV data from a previous run."""
     # Quick initial checks
     if not content or not isinstance(content, str):
         return False
         
-    # Check for our exact CSV format (16 fields, all quoted)
-    try:
-        # Split on comma, preserving quoted content
-        fields = content.split('","')
+    # Check for our exact CSV format (16 fields, all quoted).
+    # 15 separators means 16 fields; counting rejects most text without splitting.
+    sep = '","'
+    if content.count(sep) != 15:
+        return False
+        
+    # Separator offsets, found left to right as str.split would
+    seps = []
+    pos = content.find(sep)
+    while pos != -1:
+        seps.append(pos)
+        pos = content.find(sep, pos + 3)
+        
+    # First field should start with a quote
+    if seps[0] == 0 or content[0] != '"':
+        return False
+        
+    # Last field should end with a quote
+    if seps[-1] + 3 == len(content) or content[-1] != '"':
+        return False
         
-        # Should have exactly 16 fields when properly split
-        if len(fields) != 16:
-            return False
-            
-        # First field should start with a quote
-        if not fields[0].startswith('"'):
-            return False
-            
-        # Last field should end with a quote
-        if not fields[-1].endswith('"'):
-            return False
-            
-        # Check for date format in expected positions (5th and 7th fields)
-        date_pattern = r'\d{1,2}/\d{1,2}/\d{4}'
-        if not (re.search(date_pattern, fields[4]) and re.search(date_pattern, fields[6])):
-            return False
-            
-        # Check for "LinkedIn" in source field (6th field)
-        if 'LinkedIn' not in fields[5]:
-            return False
-            
-        return True
+    # Check for date format in expected positions (5th and 7th fields)
+    if not (_DATE_RE.search(content, seps[3] + 3, seps[4])
+            and _DATE_RE.search(content, seps[5] + 3, seps[6])):
+        return False
         
-    except Exception:
+    # Check for "LinkedIn" in source field (6th field)
+    if 'LinkedIn' not in content[seps[4] + 3:seps[5]]:
         return False
+        
+    return True
@@ -1,6 +1,99 @@
 import json
+import os
+import re
 from pathlib import Path
+import ijson
 import pytest
+from typing import Dict, List
+from src.utils.dir_cache import list_snapshot_names
+from src.utils.parallel import map_snapshots
+
+# Navigation content that marks a snapshot as scraped with page chrome
+_NAV_RE = re.compile('|'.join(re.escape(s) for s in (
+    "notifications total",
+    "Skip to search",
+    "Skip to main content",
+    "Keyboard shortcuts",
+    "My Network",
+    "Messaging"
+)))
+
+# Per-file issues from earlier runs, reused while a file's mtime and size are unchanged
+_CACHE_FILE = Path(".snapshot_validation_cache.json")
+_CACHE_VERSION = 3  # bump when the checks in _check_one change
+
+_SCALAR_EVENTS = frozenset(('string', 'number', 'boolean', 'null'))
+_PARSED_FIELDS = {'parsed_data.title': 'title', 'parsed_data.location': 'location'}
+
+def _read_snapshot_fields(snapshot_file: Path) -> dict:
+    """Stream a snapshot, keeping only what validation looks at.
+    
+    Every top-level key is recorded (value None unless it's raw_text), and
+    parsed_data keeps just title and location; the rest is never built.
+    """
+    data = {}
+    with open(snapshot_file, 'rb') as f:
+        for prefix, event, value in ijson.parse(f, use_float=True):
+            if prefix == '' and event == 'map_key':
+                data[value] = None
+            elif prefix == 'raw_text' and event in _SCALAR_EVENTS:
+                data['raw_text'] = value
+            elif prefix == 'parsed_data' and event == 'start_map':
+                data['parsed_data'] = {}
+            elif prefix in _PARSED_FIELDS and event in _SCALAR_EVENTS:
+                data['parsed_data'][_PARSED_FIELDS[prefix]] = value
+    return data
+
+def _check_one(snapshot_file: Path) -> List[str]:
+    """Return the issues found in a single snapshot"""
+    issues = []
+    try:
+        data = _read_snapshot_fields(snapshot_file)
+        
+        # Check for navigation content in raw_text
+        if "raw_text" in data:
+            if _NAV_RE.search(data["raw_text"]):
+                issues.append("Contains navigation content")
+                
+        # Check for expected fields
+        expected_fields = ["company", "title", "location", "raw_text", "parsed_data"]
+        missing_fields = [field for field in expected_fields if field not in data]
+        if missing_fields:
+            issues.append(f"Missing fields: {missing_fields}")
+            
+        # Check for empty or invalid values
+        if data.get("raw_text", "").strip() == "":
+            issues.append("Empty raw_text")
+            
+        if "parsed_data" in data:
+            parsed = data["parsed_data"]
+            title = parsed.get("title")
+            if not title or title == "Unknown":
+                issues.append("Missing or invalid title")
+            if not parsed.get("location"):
+                issues.append("Missing location")
+                
+    except ijson.JSONError:
+        issues.append("Invalid JSON format")
+        
+    return issues
+
+def _load_cache() -> Dict[str, dict]:
+    """Load cached per-file results, ignoring a missing, corrupt or outdated cache"""
+    try:
+        cache = json.loads(_CACHE_FILE.read_bytes())
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(cache, dict) or cache.get("version") != _CACHE_VERSION:
+        return {}
+    return cache.get("files", {})
+
+def _save_cache(files: Dict[str, dict]) -> None:
+    """Write per-file results for the next run; failing to write is not an error"""
+    try:
+        _CACHE_FILE.write_text(json.dumps({"version": _CACHE_VERSION, "files": files}))
+    except OSError:
+        pass
 
 def validate_snapshots():
     """Validate snapshot data quality and identify potentially corrupt snapshots"""
@@ -15,63 +108,36 @@ def validate_snapshots():
     print(f"\nChecking snapshots in: {snapshots_dir}")
     print("-" * 50)
     
-    for snapshot_file in snapshots_dir.glob("linkedin_snapshot_*.json"):
+    # Changed files are checked in worker processes; results are reported in order here
+    snapshot_files = [snapshots_dir / name for name in list_snapshot_names(snapshots_dir)]
+    cache = _load_cache()
+    new_cache = {}
+    stale = []
+    for snapshot_file in snapshot_files:
+        st = os.stat(snapshot_file)
+        entry = cache.get(snapshot_file.name)
+        if (isinstance(entry, dict) and "issues" in entry
+                and entry.get("mtime_ns") == st.st_mtime_ns and entry.get("size") == st.st_size):
+            new_cache[snapshot_file.name] = entry
+        else:
+            new_cache[snapshot_file.name] = {"mtime_ns": st.st_mtime_ns, "size": st.st_size}
+            stale.append(snapshot_file)
+    for snapshot_file, file_issues in zip(stale, map_snapshots(_check_one, stale, chunksize=16)):
+        new_cache[snapshot_file.name]["issues"] = file_issues
+    _save_cache(new_cache)
+    
+    for snapshot_file in snapshot_files:
+        file_issues = new_cache[snapshot_file.name]["issues"]
         snapshot_count += 1
         print(f"\nAnalyzing: {snapshot_file.name}")
         
-        try:
-            with open(snapshot_file) as f:
-                data = json.load(f)
-                
-                # Check for navigation content in raw_text
-                nav_indicators = [
-                    "notifications total",
-                    "Skip to search",
-                    "Skip to main content",
-                    "Keyboard shortcuts",
-                    "My Network",
-                    "Messaging"
-                ]
-                
-                if "raw_text" in data:
-                    if any(ind in data["raw_text"] for ind in nav_indicators):
-                        issue = f"Contains navigation content"
-                        issues.append(f"{snapshot_file.name}: {issue}")
-                        print(f"  ❌ {issue}")
-                        
-                # Check for expected fields
-                expected_fields = ["company", "title", "location", "raw_text", "parsed_data"]
-                missing_fields = [field for field in expected_fields if field not in data]
-                if missing_fields:
-                    issue = f"Missing fields: {missing_fields}"
-                    issues.append(f"{snapshot_file.name}: {issue}")
-                    print(f"  ❌ {issue}")
-                    
-                # Check for empty or invalid values
-                if data.get("raw_text", "").strip() == "":
-                    issue = "Empty raw_text"
-                    issues.append(f"{snapshot_file.name}: {issue}")
-                    print(f"  ❌ {issue}")
-                    
-                if "parsed_data" in data:
-                    parsed = data["parsed_data"]
-                    if not parsed.get("title") or parsed.get("title") == "Unknown":
-                        issue = "Missing or invalid title"
-                        issues.append(f"{snapshot_file.name}: {issue}")
-                        print(f"  ❌ {issue}")
-                    if not parsed.get("location"):
-                        issue = "Missing location"
-                        issues.append(f"{snapshot_file.name}: {issue}")
-                        print(f"  ❌ {issue}")
-                
-                if not issues:
-                    print("  ✅ Snapshot looks valid")
-                    
-        except json.JSONDecodeError:
-            issue = "Invalid JSON format"
+        for issue in file_issues:
             issues.append(f"{snapshot_file.name}: {issue}")
             print(f"  ❌ {issue}")
             
+        if not issues:
+            print("  ✅ Snapshot looks valid")
+            
     print("\n" + "=" * 50)
     print(f"Snapshot Analysis Summary:")
     print(f"Total snapshots checked: {snapshot_count}")